@@ -4,6 +4,7 @@ import pdfplumber
 import os
 import glob
 import re
+from ordmatchning import GEMEN_FALT
 
 # --- INSTÄLLNINGAR ---
 DB_PATH = "data/debatt_db" 
@@ -76,7 +77,8 @@ def load_program():
                         "år": ar,
                         "källa": filnamn,
                         "dok_id": f"PROG-{parti}-{ar}",
-                        "nummer": i
+                        "nummer": i,
+                        GEMEN_FALT: enhanced_text.lower()
                     }
                     
                     all_ids.append(doc_id)
@@ -9,6 +9,8 @@ from chromadb.utils import embedding_functions
 import chromadb
 from google import genai
 from dotenv import load_dotenv
+from ordmatchning import GEMEN_FALT, gemen_text, kompilera_sokord, rakna_traffar, summera_per_parti
+from sidindelning import hamta_ids, iterera_sidor
 
 st.set_page_config(page_title="Käbbel-AI", page_icon="👺", layout="wide")
 load_dotenv()
@@ -73,29 +75,40 @@ def analyse_needs(user_query, api_key):
         return {"is_relevant": True, "need_statistics": False, "partier": [], "start_year": 2022, "end_year": now_year, "need_program": True, "search_word_debate": [user_query], "topic_program": user_query}
 
 def get_statistics(collection, search_word_debate, start_year, end_year):
-    """Räknar exakta ordträffar (icke-semantisk). Används för att få exakt statistik från databasen."""
+    """
+    Räknar exakta ordträffar (icke-semantisk). Används för att få exakt statistik från databasen.
+    Returnerar antal anföranden och antal omnämnanden per parti, samt anföranden per parti och år.
+    """
     valid_year = [str(y) for y in range(start_year, end_year + 1)]
     riktiga_partier = list(PARTI_FÄRGER.keys()) 
     
     stats = {p: 0 for p in riktiga_partier}
-    all_data = collection.get(
-        where={"år": {"$in": valid_year}}, 
-        include=['documents', 'metadatas']
-    )
-    
-    if not all_data['documents']:
-        return stats
+    tom = {"dokument": stats, "forekomster": dict(stats), "per_ar": {}}
+    monster = kompilera_sokord(search_word_debate)
+    if monster is None:
+        return tom
 
-    for doc, meta in zip(all_data['documents'], all_data['metadatas']):
-        doc_lower = doc.lower()
-        p_kod = meta.get('parti', '').upper()
-        
-        match = any(ordet.lower() in doc_lower for ordet in search_word_debate)
-        
-        if match and p_kod in stats:
-            stats[p_kod] += 1
-                
-    return dict(sorted(stats.items(), key=lambda x: x[1], reverse=True))
+    ids = hamta_ids(collection, where={"år": {"$in": valid_year}})
+    if not ids:
+        return tom
+
+    def rader():
+        for sida in iterera_sidor(collection, ids, include=['metadatas']):
+            # Äldre databaser saknar den gemenade texten, hämta då dokumenten för just de id:na
+            saknas = [i for i, m in zip(sida['ids'], sida['metadatas']) if GEMEN_FALT not in m]
+            fallback = {}
+            if saknas:
+                res = collection.get(ids=saknas, include=['documents'])
+                fallback = dict(zip(res['ids'], res['documents']))
+            for i, m in zip(sida['ids'], sida['metadatas']):
+                yield gemen_text(fallback.get(i), m), m
+
+    traffar = rakna_traffar(monster, rader(), giltiga_partier=stats)
+    return {
+        "dokument": summera_per_parti(traffar["dokument"], riktiga_partier),
+        "forekomster": summera_per_parti(traffar["forekomster"], riktiga_partier),
+        "per_ar": traffar["dokument"],
+    }
 
 def sort_newest_first(kontext_lista):
     def get_date(text_rad):
@@ -213,14 +226,28 @@ if st.button("ANALYS", use_container_width=True):
                 with st.spinner("Beräknar statistik..."):
                     statistik_data = get_statistics(collection, search_word_debate, start_year, end_year)
                         
-                    df_stat = pd.DataFrame(list(statistik_data.items()), columns=['Parti', 'Antal'])
+                    df_stat = pd.DataFrame(list(statistik_data["dokument"].items()), columns=['Parti', 'Antal'])
                     fig = px.bar(df_stat, x='Parti', y='Antal', color='Parti', 
                                     title=f"Aktivitet i kammaren gällande: {', '.join(search_word_debate)}",
                                     color_discrete_map=PARTI_FÄRGER)
                     st.plotly_chart(fig, use_container_width=True)
+
+                    if end_year > start_year and statistik_data["per_ar"]:
+                        rader = [(p, ar, antal) for p, ar_dict in statistik_data["per_ar"].items() for ar, antal in ar_dict.items()]
+                        df_ar = pd.DataFrame(rader, columns=['Parti', 'År', 'Antal']).sort_values('År')
+                        fig_ar = px.line(df_ar, x='År', y='Antal', color='Parti', markers=True,
+                                        title="Anföranden per år", color_discrete_map=PARTI_FÄRGER)
+                        st.plotly_chart(fig_ar, use_container_width=True)
                         
-                    stat_summary = "\n".join([f"{p}: {antal} anföranden" for p, antal in statistik_data.items()])
-                    context_str = f"STATISTIK ÖVER SÖKORD ({', '.join(search_word_debate)}):\n{stat_summary}"
+                    stat_summary = "\n".join([
+                        f"{p}: {antal} anföranden, {statistik_data['forekomster'].get(p, 0)} omnämnanden"
+                        for p, antal in statistik_data["dokument"].items()
+                    ])
+                    ar_summary_rader = "\n".join([
+                        f"{p} {ar}: {antal} anföranden"
+                        for p, ar_dict in statistik_data["per_ar"].items() for ar, antal in sorted(ar_dict.items())
+                    ])
+                    context_str = f"STATISTIK ÖVER SÖKORD ({', '.join(search_word_debate)}):\n{stat_summary}\n\nPER ÅR:\n{ar_summary_rader}"
             else:
                 with st.spinner("Hämtar och sorterar textdata..."):
                     raw_context = get_smart_context(
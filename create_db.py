@@ -3,6 +3,7 @@ from chromadb.utils import embedding_functions
 import json
 import os
 import hashlib
+from ordmatchning import GEMEN_FALT
 
 DB_PATH = "data/debatt_db" 
 MODEL_NAME = "paraphrase-multilingual-MiniLM-L12-v2"
@@ -74,7 +75,8 @@ def processa_rad(data):
             "dok_id": data['dok_id'],
             "nummer": data.get("nummer", 0),
             "rubrik": rubrik, 
-            "replik": data.get("ar_replik", "N") 
+            "replik": data.get("ar_replik", "N"),
+            GEMEN_FALT: text_content.lower()
         }
         return doc_id, text_content, meta
     return None
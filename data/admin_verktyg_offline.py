@@ -2,9 +2,13 @@ import chromadb
 from chromadb.utils import embedding_functions
 import os
 import numpy as np
+from ordmatchning import gemen_text, kompilera_sokord, matchar, utan_gemen_text
+from sidindelning import exportera_jsonl, hamta_ids, iterera_sidor, radera_i_batcher
+
+# Körs från repots rot: python -m data.admin_verktyg_offline
 
 # --- INSTÄLLNINGAR ---
-DB_PATH = "debatt_db" 
+DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "debatt_db")
 MODEL_NAME = "paraphrase-multilingual-MiniLM-L12-v2"
 
 def admin_panel():
@@ -32,7 +36,8 @@ def admin_panel():
         print("1. Sök & Jämför (Parti + Ämne + År)")
         print("2. Inspektera specifikt ID")
         print("3. Radera via Metadata (Typ/År/Parti)")
-        print("4.  Ordsök")
+        print("4. Ordsök")
+        print("5. Exportera till JSONL (Typ/År/Parti eller allt)")
         print("q. Avsluta")
         
         val = input("\nVälj alternativ: ")
@@ -84,7 +89,7 @@ def admin_panel():
             res = collection.get(ids=[sok_id])
             if res['ids']:
                 print(f"\n📄 ID: {res['ids'][0]}")
-                print(f"Metadata: {res['metadatas'][0]}")
+                print(f"Metadata: {utan_gemen_text(res['metadatas'][0])}")
                 print(f"Text: {res['documents'][0]}")
             else:
                 print("Hittades ej.")
@@ -93,47 +98,81 @@ def admin_panel():
             key = input("Radera via (typ/år/parti): ").lower()
             val_to_delete = input(f"Värde för {key}: ")
             
-            confirm = input(f"⚠️ Är du helt säker på att radera ALLA {key}='{val_to_delete}'? (ja/nej): ")
+            ids = hamta_ids(collection, {key: val_to_delete})
+            antal = len(ids)
+            if antal == 0:
+                print(f"Inga dokument matchar {key}='{val_to_delete}'.")
+                continue
+
+            confirm = input(f"⚠️ Är du helt säker på att radera ALLA {antal} dokument med {key}='{val_to_delete}'? (ja/nej): ")
             if confirm.lower() == "ja":
-                collection.delete(where={key: val_to_delete})
-                print("Radering slutförd.")
+                raderade = radera_i_batcher(collection, ids)
+                print(f"Radering slutförd. {raderade} dokument raderade.")
         
         elif val == "4":
-            ordet = input("Vilket ord letar du efter? (t.ex. 'invandring'): ").lower()
+            ordet = input("Vilket ord letar du efter? (flera separeras med komma, t.ex. 'invandring, migration'): ")
             ar = input("Vilket år? ")
             parti_filter = input("Filtrera på parti (S/M/SD/etc) eller tryck ENTER för alla: ").upper()
             
+            monster = kompilera_sokord(ordet.split(","))
+            if monster is None:
+                print("Inget sökord angivet.")
+                continue
+
             print(f"Scannar databasen efter '{ordet}' år {ar}...")
             
-            all_data = collection.get(
-                where={"år": ar}, 
-                include=['documents', 'metadatas']
-            )
-            
-            if not all_data['documents']:
-                print(f"Hittade ingen data alls för år {ar}. Kontrollera att året är sparat som metadata.")
-                continue
+            where = {"$and": [{"år": ar}, {"parti": parti_filter}]} if parti_filter else {"år": ar}
 
             hits = 0
-            for d, m, i in zip(all_data['documents'], all_data['metadatas'], all_data['ids']):
-                texten_matchar = ordet in d.lower()
-                metadata_matchar = ordet in str(m).lower()
-                
-                parti_matchar = True
-                if parti_filter and m.get('parti') != parti_filter:
-                    parti_matchar = False
-
-                if (texten_matchar or metadata_matchar) and parti_matchar:
-                    print(f"\nTRÄFF! ID: {i}")
-                    print(f"Talare: {m.get('talare')} ({m.get('parti')}) | Datum: {m.get('datum')}")
-                    print(f"Text: {d[:200]}...")
-                    hits += 1
-                    if hits >= 20: 
-                        print("\n...visar de 20 första träffarna. Det finns troligen fler.")
-                        break
+            scannade = 0
+            for sida in iterera_sidor(collection, hamta_ids(collection, where), include=['documents', 'metadatas']):
+                for d, m, i in zip(sida['documents'], sida['metadatas'], sida['ids']):
+                    scannade += 1
+                    if matchar(monster, gemen_text(d, m)) or matchar(monster, str(utan_gemen_text(m)).lower()):
+                        print(f"\nTRÄFF! ID: {i}")
+                        print(f"Talare: {m.get('talare')} ({m.get('parti')}) | Datum: {m.get('datum')}")
+                        print(f"Text: {d[:200]}...")
+                        hits += 1
+                        if hits >= 20: 
+                            break
+                if hits >= 20:
+                    print("\n...visar de 20 första träffarna. Det finns troligen fler.")
+                    break
             
-            if hits == 0:
+            if scannade == 0 and parti_filter:
+                print(f"Hittade inga dokument för {parti_filter} år {ar}.")
+            elif scannade == 0:
+                print(f"Hittade ingen data alls för år {ar}. Kontrollera att året är sparat som metadata.")
+            elif hits == 0:
                 print(f"Inga träffar för '{ordet}' hos {parti_filter if parti_filter else 'något parti'} under {ar}.")
 
+        elif val == "5":
+            key = input("Exportera via (typ/år/parti) eller tryck ENTER för allt: ").lower()
+            where = None
+            if key:
+                val_to_export = input(f"Värde för {key}: ")
+                where = {key: val_to_export}
+            filnamn = input("Filnamn (t.ex. export.jsonl): ") or "export.jsonl"
+
+            if os.path.exists(filnamn):
+                confirm = input(f"⚠️ Filen '{filnamn}' finns redan och skrivs över. Fortsätta? (ja/nej): ")
+                if confirm.lower() != "ja":
+                    print("Export avbruten.")
+                    continue
+
+            ids = hamta_ids(collection, where)
+            antal = len(ids)
+            if antal == 0:
+                print("Inga dokument matchar filtret.")
+                continue
+
+            print(f"Exporterar {antal} dokument till '{filnamn}'...")
+            try:
+                exporterade = exportera_jsonl(collection, filnamn, ids)
+            except OSError as e:
+                print(f"Kunde inte skriva till '{filnamn}': {e}")
+                continue
+            print(f"Export slutförd. {exporterade} dokument skrivna.")
+
 if __name__ == "__main__":
     admin_panel()
\ No newline at end of file
@@ -0,0 +1,65 @@
+from collections import defaultdict
+
+# Gemensam ordmatchning för appen (KabbelAI.py) och admin-verktyget (data/admin_verktyg_offline.py).
+# Texten gemenas EN gång vid inläsning (create_db.py / Add_program_to_db.py) och sparas i
+# metadatafältet GEMEN_FALT, så sökningen jämför bara gemena sökord mot färdig gemen text.
+
+GEMEN_FALT = "text_gemen"
+
+def gemen_text(doc, meta):
+    """Den gemenade texten för ett dokument. Faller tillbaka på doc.lower() för äldre databaser."""
+    if meta and meta.get(GEMEN_FALT):
+        return meta[GEMEN_FALT]
+    return doc.lower() if doc else ""
+
+def utan_gemen_text(meta):
+    """Metadata utan den gemenade textkopian (den är bara till för ordsök)."""
+    return {k: v for k, v in meta.items() if k != GEMEN_FALT}
+
+def kompilera_sokord(sokord):
+    """Gemenar och rensar sökorden en gång. Returnerar None om listan saknar ord."""
+    if isinstance(sokord, str):
+        sokord = [sokord]
+    ord_lista = {o.strip().lower() for o in sokord if o and o.strip()}
+    if not ord_lista:
+        return None
+    return tuple(sorted(ord_lista))
+
+def matchar(monster, text_gemen):
+    """True om den (redan gemenade) texten innehåller minst ett av sökorden."""
+    if monster is None or not text_gemen:
+        return False
+    return any(o in text_gemen for o in monster)
+
+def rakna_forekomster(monster, text_gemen):
+    """Antal förekomster av sökorden i den (redan gemenade) texten, summerat över alla sökord."""
+    if monster is None or not text_gemen:
+        return 0
+    return sum(text_gemen.count(o) for o in monster)
+
+def rakna_traffar(monster, rader, giltiga_partier=None):
+    """
+    Räknar dokumentträffar och ordförekomster per parti och år över (text_gemen, meta)-par.
+    Returnerar {"dokument": {parti: {år: antal}}, "forekomster": {parti: {år: antal}}}.
+    """
+    dok_traffar = defaultdict(lambda: defaultdict(int))
+    forekomster = defaultdict(lambda: defaultdict(int))
+
+    for text_gemen, meta in rader:
+        p_kod = (meta.get('parti') or '').upper()
+        if giltiga_partier is not None and p_kod not in giltiga_partier:
+            continue
+        if not matchar(monster, text_gemen):
+            continue
+        ar = str(meta.get('år', '?'))
+        dok_traffar[p_kod][ar] += 1
+        forekomster[p_kod][ar] += rakna_forekomster(monster, text_gemen)
+
+    return {"dokument": dok_traffar, "forekomster": forekomster}
+
+def summera_per_parti(per_ar, partier=None):
+    """Slår ihop {parti: {år: antal}} till {parti: antal}, sorterat med flest träffar först."""
+    summa = {p: 0 for p in (partier or [])}
+    for p_kod, ar_dict in per_ar.items():
+        summa[p_kod] = summa.get(p_kod, 0) + sum(ar_dict.values())
+    return dict(sorted(summa.items(), key=lambda x: x[1], reverse=True))
@@ -0,0 +1,44 @@
+import json
+from ordmatchning import utan_gemen_text
+
+# Sidvis läsning av en Chroma-collection med begränsat minne.
+# Först hämtas bara id:n för filtret (litet per dokument), sedan hämtas dokumenten i
+# bitar om SIDSTORLEK via get(ids=...). Det blir O(n) till skillnad från limit/offset,
+# som i Chromas SQLite-backend kostar O(offset) per sida.
+
+SIDSTORLEK = 500
+
+def hamta_ids(collection, where=None):
+    """Alla id:n som matchar filtret. Längden är samtidigt antalet dokument."""
+    return collection.get(where=where, include=[])['ids']
+
+def iterera_sidor(collection, ids, include=None, sidstorlek=SIDSTORLEK):
+    """Hämtar dokumenten för ids i bitar om sidstorlek, en sida i taget."""
+    for i in range(0, len(ids), sidstorlek):
+        yield collection.get(ids=ids[i:i + sidstorlek], include=include or [])
+
+def radera_i_batcher(collection, ids, sidstorlek=SIDSTORLEK):
+    """
+    Raderar exakt de id:n som visades innan bekräftelse, i batcher.
+    Dokument som lagts till efter räkningen rörs inte.
+    """
+    raderade = 0
+    for i in range(0, len(ids), sidstorlek):
+        batch = ids[i:i + sidstorlek]
+        collection.delete(ids=batch)
+        raderade += len(batch)
+        print(f"   Raderat {raderade} av {len(ids)} ...", end="\r")
+    print()
+    return raderade
+
+def exportera_jsonl(collection, filnamn, ids, sidstorlek=SIDSTORLEK):
+    """Strömmar dokument + metadata till en JSONL-fil, en rad per dokument."""
+    antal = 0
+    with open(filnamn, 'w', encoding='utf-8') as f:
+        for sida in iterera_sidor(collection, ids, include=['documents', 'metadatas'], sidstorlek=sidstorlek):
+            for doc_id, doc, meta in zip(sida['ids'], sida['documents'], sida['metadatas']):
+                f.write(json.dumps({"id": doc_id, "text": doc, "metadata": utan_gemen_text(meta)}, ensure_ascii=False) + "\n")
+                antal += 1
+            print(f"   Exporterat {antal} av {len(ids)} ...", end="\r")
+    print()
+    return antal
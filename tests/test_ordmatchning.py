@@ -0,0 +1,55 @@
+from ordmatchning import (
+    GEMEN_FALT, gemen_text, kompilera_sokord, matchar, rakna_forekomster, rakna_traffar, summera_per_parti
+)
+
+
+def test_kompilera_tom_lista_ger_none():
+    assert kompilera_sokord([]) is None
+    assert kompilera_sokord(["", "   "]) is None
+    assert kompilera_sokord("") is None
+
+def test_kompilera_gemenar_och_tar_bort_dubbletter():
+    assert kompilera_sokord("Klimat") == ("klimat",)
+    assert kompilera_sokord(["klimat", " Klimatpolitik ", "KLIMAT"]) == ("klimat", "klimatpolitik")
+
+def test_gemen_text_anvander_sparat_falt():
+    assert gemen_text("Original", {GEMEN_FALT: "sparad"}) == "sparad"
+    assert gemen_text("Original", {}) == "original"
+    assert gemen_text(None, {}) == ""
+
+def test_matchar_ar_skiftlagesokanslig():
+    monster = kompilera_sokord(["Invandring"])
+    assert matchar(monster, gemen_text("om INVANDRING och integration", {}))
+    assert not matchar(monster, "om migration")
+    assert not matchar(None, "invandring")
+    assert not matchar(monster, "")
+
+def test_aao_hanteras():
+    monster = kompilera_sokord(["Försvar", "ÄLDREVÅRD"])
+    assert matchar(monster, gemen_text("FÖRSVARET måste stärkas", {}))
+    assert rakna_forekomster(monster, gemen_text("Äldrevården och äldrevård, Försvar", {})) == 3
+
+def test_rakna_forekomster():
+    monster = kompilera_sokord(["skatt", "skola"])
+    assert rakna_forekomster(monster, "skatt, skola och mer skatt") == 3
+    assert rakna_forekomster(monster, "ingenting") == 0
+    assert rakna_forekomster(None, "skatt") == 0
+
+def test_rakna_traffar_per_parti_och_ar():
+    monster = kompilera_sokord(["Klimat"])
+    texter = ["klimat klimat", "klimat", "inget", "klimat", "klimat"]
+    metadatas = [
+        {"parti": "s", "år": "2020"},
+        {"parti": "S", "år": "2021"},
+        {"parti": "M", "år": "2020"},
+        {"parti": "M", "år": "2020"},
+        {"parti": "X", "år": "2020"},
+    ]
+    res = rakna_traffar(monster, zip(texter, metadatas), giltiga_partier={"S", "M"})
+    assert res["dokument"] == {"S": {"2020": 1, "2021": 1}, "M": {"2020": 1}}
+    assert res["forekomster"] == {"S": {"2020": 2, "2021": 1}, "M": {"2020": 1}}
+
+def test_summera_per_parti():
+    per_ar = {"S": {"2020": 1, "2021": 4}, "M": {"2020": 2}}
+    assert summera_per_parti(per_ar, ["S", "M", "C"]) == {"S": 5, "M": 2, "C": 0}
+    assert list(summera_per_parti(per_ar)) == ["S", "M"]
@@ -0,0 +1,76 @@
+import json
+
+from ordmatchning import GEMEN_FALT
+from sidindelning import SIDSTORLEK, exportera_jsonl, hamta_ids, iterera_sidor, radera_i_batcher
+
+
+class FakeCollection:
+    """Minimal Chroma-liknande collection i minnet: get(ids/where/include) och delete(ids)."""
+
+    def __init__(self, antal, ar="2020"):
+        self.data = {
+            f"id{i:05d}": (f"Text {i}", {"år": ar, "parti": "S" if i % 2 else "M", GEMEN_FALT: f"text {i}"})
+            for i in range(antal)
+        }
+        self.get_anrop = []
+
+    def get(self, ids=None, where=None, include=None, limit=None, offset=None):
+        self.get_anrop.append({"ids": ids, "where": where, "limit": limit, "offset": offset})
+        valda = [i for i in (ids if ids is not None else sorted(self.data)) if i in self.data]
+        if where:
+            valda = [i for i in valda if all(self.data[i][1].get(k) == v for k, v in where.items())]
+        include = include or []
+        return {
+            "ids": valda,
+            "documents": [self.data[i][0] for i in valda] if "documents" in include else None,
+            "metadatas": [self.data[i][1] for i in valda] if "metadatas" in include else None,
+        }
+
+    def delete(self, ids):
+        for i in ids:
+            self.data.pop(i, None)
+
+
+def test_sidgrans_exakt_multipel_av_sidstorlek():
+    col = FakeCollection(2 * SIDSTORLEK)
+    ids = hamta_ids(col)
+    sidor = list(iterera_sidor(col, ids, include=['metadatas']))
+    assert len(ids) == 2 * SIDSTORLEK
+    assert [len(s['ids']) for s in sidor] == [SIDSTORLEK, SIDSTORLEK]
+    assert sum((s['ids'] for s in sidor), []) == ids
+    assert all(a["offset"] is None for a in col.get_anrop)
+
+def test_tomt_resultat():
+    col = FakeCollection(10)
+    ids = hamta_ids(col, {"år": "1999"})
+    assert ids == []
+    assert list(iterera_sidor(col, ids)) == []
+    assert radera_i_batcher(col, ids) == 0
+    assert len(col.data) == 10
+
+def test_radera_exakt_filtrerad_mangd():
+    col = FakeCollection(25)
+    ids = hamta_ids(col, {"parti": "S"})
+    assert radera_i_batcher(col, ids, sidstorlek=4) == len(ids) == 12
+    assert len(col.data) == 13
+    assert all(meta["parti"] == "M" for _, meta in col.data.values())
+
+def test_radera_ror_inte_dokument_tillagda_efter_rakning():
+    col = FakeCollection(6)
+    ids = hamta_ids(col, {"parti": "S"})
+    col.data["ny"] = ("Ny", {"år": "2020", "parti": "S"})
+    radera_i_batcher(col, ids, sidstorlek=2)
+    assert "ny" in col.data
+    assert hamta_ids(col, {"parti": "S"}) == ["ny"]
+
+def test_exportera_jsonl_rundtur(tmp_path):
+    col = FakeCollection(7)
+    ids = hamta_ids(col, {"parti": "M"})
+    fil = tmp_path / "export.jsonl"
+    assert exportera_jsonl(col, str(fil), ids, sidstorlek=3) == 4
+    rader = [json.loads(r) for r in fil.read_text(encoding="utf-8").splitlines()]
+    assert [r["id"] for r in rader] == ids
+    for r in rader:
+        text, meta = col.data[r["id"]]
+        assert r["text"] == text
+        assert r["metadata"] == {k: v for k, v in meta.items() if k != GEMEN_FALT}